@@ -6,6 +6,7 @@ from aiogram import Bot, Dispatcher, types
 from aiogram.types import Message
 from aiogram.filters import CommandStart
 from dotenv import load_dotenv
+from trainingbot.access_control import setup_access_control
 from aiogram.enums.parse_mode import ParseMode
 
 # Загружаем переменные окружения
@@ -25,6 +26,8 @@ logger = logging.getLogger(__name__)
 
 bot = Bot(token=TOKEN)
 dp = Dispatcher()
+# Проверка доступа и защита от флуда до запуска хендлеров
+setup_access_control(dp)
 
 # Хранилище контекста диалогов пользователей
 user_contexts = {}
@@ -1,5 +1,5 @@
 @echo off
 cd /d "%~dp0"
 echo Запуск бота...
-python task5.py
+python -m trainingbot %*
 pause
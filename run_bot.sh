@@ -0,0 +1,4 @@
+#!/bin/sh
+cd "$(dirname "$0")"
+echo "Запуск бота..."
+exec python3 -m trainingbot "$@"
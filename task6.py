@@ -11,6 +11,7 @@ from aiogram.enums.parse_mode import ParseMode
 from aiogram.filters import Command
 from aiogram.fsm.storage.memory import MemoryStorage
 from dotenv import load_dotenv
+from trainingbot.access_control import setup_access_control
 import traceback
 
 # Загружаем переменные окружения из файла .env
@@ -32,6 +33,8 @@ logger = logging.getLogger(__name__)
 bot = Bot(token=TOKEN)
 # Создаем объект диспетчера для обработки команд с использованием MemoryStorage
 dp = Dispatcher(storage=MemoryStorage())
+# Проверка доступа и защита от флуда до запуска хендлеров
+setup_access_control(dp)
 
 inline_kb = InlineKeyboardMarkup(inline_keyboard=[
     [InlineKeyboardButton(text="Перейти на сайт", url="https://example.com")],
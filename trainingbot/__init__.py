@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Учебный Telegram-бот: общая точка входа для всех заданий (python -m trainingbot)."""
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Задание 8: авторизация по Telegram ID и защита от флуда.
+
+AccessMiddleware подключается к диспетчеру как outer-middleware для апдейтов,
+поэтому апдейты от чужих пользователей и от тех, кто превысил лимит,
+отбрасываются до запуска хендлеров и любых запросов к внешним API.
+"""
+
+import os
+import time
+import logging
+from aiogram import BaseMiddleware
+
+logger = logging.getLogger(__name__)
+
+
+class Allowlist:
+    """Множество разрешенных ID, которое перечитывается из файла без перезапуска."""
+
+    def __init__(self, path, check_interval=5.0):
+        self.path = path
+        self.check_interval = check_interval  # Как часто проверять изменение файла (в секундах)
+        self.users = frozenset()
+        self._mtime = None
+        self._next_check = 0.0
+        self.reload()
+
+    def reload(self):
+        """Перечитывает файл: один ID на строку, строки с # - комментарии."""
+        users = set()
+        try:
+            mtime = os.stat(self.path).st_mtime
+            if mtime == self._mtime:
+                return
+            with open(self.path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except (OSError, UnicodeDecodeError) as e:
+            # Оставляем прежний список, файл перечитается при следующей проверке
+            logger.error(f"Не удалось прочитать список разрешенных пользователей {self.path}: {e}")
+            return
+        for line in lines:
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            try:
+                users.add(int(line))
+            except ValueError:
+                logger.warning(f"Некорректный ID в списке разрешенных пользователей: {line}")
+        self.users = frozenset(users)
+        self._mtime = mtime
+        logger.info(f"Список разрешенных пользователей загружен: {len(users)}")
+
+    def __contains__(self, user_id):
+        now = time.monotonic()
+        # Файл проверяется не чаще одного раза в check_interval секунд
+        if now >= self._next_check:
+            self._next_check = now + self.check_interval
+            self.reload()
+        return user_id in self.users
+
+
+class TokenBucketLimiter:
+    """Ограничивает частоту апдейтов для каждого пользователя (token bucket)."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate  # Сколько апдейтов в секунду восполняется
+        self.burst = burst  # Максимальный запас апдейтов
+        # user_id -> [оставшиеся токены, время последнего обновления]
+        self._buckets = {}
+        self._next_cleanup = time.monotonic() + 60
+
+    def allow(self, user_id):
+        now = time.monotonic()
+        bucket = self._buckets.get(user_id)
+        if bucket is None:
+            self._buckets[user_id] = [self.burst - 1, now]
+            self._cleanup(now)
+            return True
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if tokens < 1:
+            bucket[0] = tokens
+            return False
+        bucket[0] = tokens - 1
+        return True
+
+    def _cleanup(self, now):
+        """Удаляет корзины, которые уже успели полностью восстановиться."""
+        if now < self._next_cleanup:
+            return
+        self._next_cleanup = now + 60
+        idle = self.burst / self.rate
+        for user_id in [u for u, b in self._buckets.items() if now - b[1] > idle]:
+            del self._buckets[user_id]
+
+
+class AccessMiddleware(BaseMiddleware):
+    """Отбрасывает апдейты от неразрешенных пользователей и от флудеров."""
+
+    def __init__(self, allowlist=None, limiter=None):
+        self.allowlist = allowlist
+        self.limiter = limiter
+
+    async def __call__(self, handler, event, data):
+        user = data.get("event_from_user")
+        if user is None:
+            return await handler(event, data)
+        if self.allowlist is not None and user.id not in self.allowlist:
+            logger.info(f"Апдейт от неразрешенного пользователя {user.id} отброшен")
+            return None
+        if self.limiter is not None and not self.limiter.allow(user.id):
+            logger.info(f"Пользователь {user.id} превысил лимит запросов, апдейт отброшен")
+            return None
+        return await handler(event, data)
+
+
+def setup_access_control(dp):
+    """Подключает middleware к диспетчеру по настройкам из .env."""
+    allowed_users_file = os.getenv("ALLOWED_USERS_FILE")  # Файл со списком разрешенных ID
+    rate = float(os.getenv("RATE_LIMIT", "1"))  # Апдейтов в секунду на пользователя
+    burst = float(os.getenv("RATE_BURST", "5"))  # Допустимый всплеск апдейтов
+    allowlist = Allowlist(allowed_users_file) if allowed_users_file else None
+    limiter = TokenBucketLimiter(rate, burst) if rate > 0 else None
+    dp.update.outer_middleware(AccessMiddleware(allowlist, limiter))
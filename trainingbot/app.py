@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Единая точка входа бота: python -m trainingbot [--profile-startup]
+
+Загружает .env, настраивает логирование, создает Bot и Dispatcher и подключает
+модули из trainingbot.features как роутеры. Список модулей задается переменной
+BOT_FEATURES (через запятую), по умолчанию подключаются все, а chatgpt -
+только при заданном OPENAI_API_KEY.
+"""
+
+import os
+import sys
+import asyncio
+import logging
+import importlib
+from trainingbot.startup import StartupProfiler
+
+logger = logging.getLogger(__name__)
+
+# Порядок важен: chatgpt обрабатывает все оставшиеся сообщения и должен идти последним
+DEFAULT_FEATURES = ["admin", "start", "random_pic", "currency", "reminders", "chatgpt"]
+
+
+def selected_features():
+    """Возвращает список модулей-функций по настройкам из .env."""
+    features = os.getenv("BOT_FEATURES")
+    if features:
+        return [name.strip() for name in features.split(",") if name.strip()]
+    return [name for name in DEFAULT_FEATURES if name != "chatgpt" or os.getenv("OPENAI_API_KEY")]
+
+
+def main():
+    # Отчет о запуске включается флагом --profile-startup или переменной STARTUP_PROFILE=1
+    profiler = StartupProfiler("--profile-startup" in sys.argv or os.getenv("STARTUP_PROFILE") == "1")
+
+    with profiler.step("config"):
+        from dotenv import load_dotenv
+        # Загружаем переменные окружения из файла .env
+        load_dotenv(".env")
+        token = os.getenv("BOT_TOKEN")  # Токен бота
+        logpath = os.getenv("LOG_PATH")  # Путь к файлу логов
+        # Проверяем, что переменные окружения загружены
+        if not token:
+            raise ValueError("Переменная BOT_TOKEN не найдена в .env файле")
+        if not logpath:
+            raise ValueError("Переменная LOG_PATH не найдена в .env файле")
+        logging.basicConfig(filename=logpath, level=logging.INFO)
+
+    with profiler.step("aiogram"):
+        from aiogram import Bot, Dispatcher
+        from aiogram.fsm.storage.memory import MemoryStorage
+
+    with profiler.step("bot + dispatcher"):
+        from trainingbot.access_control import setup_access_control
+        bot = Bot(token=token)
+        dp = Dispatcher(storage=MemoryStorage())
+        # Проверка доступа и защита от флуда до запуска хендлеров
+        setup_access_control(dp)
+
+    bot_commands = []
+    for name in selected_features():
+        with profiler.step(f"import features.{name}"):
+            module = importlib.import_module(f"trainingbot.features.{name}")
+        with profiler.step(f"init features.{name}"):
+            dp.include_router(module.router)
+            bot_commands.extend(module.commands)
+    # Список команд доступен хендлерам как аргумент bot_commands
+    dp["bot_commands"] = bot_commands
+
+    report = profiler.report()
+    if report:
+        logger.info(report)
+        print(report)
+
+    try:
+        asyncio.run(run(bot, dp, bot_commands))
+    except Exception as e:
+        logger.error(f"Ошибка: {e}")
+        print(f"Ошибка: {e}")
+
+
+async def run(bot, dp, bot_commands):
+    """Устанавливает меню команд и запускает опрос обновлений."""
+    await bot.set_my_commands(bot_commands)
+    print("Бот запускается...")
+    logger.info("Бот включается")
+    await dp.start_polling(bot, shutdown_timeout=5)
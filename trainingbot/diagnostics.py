@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+Диагностика работающего бота без перезапуска.
+
+- SamplingProfiler: отдельный поток раз в interval секунд снимает стек потока
+  event loop и считает одинаковые стеки (формат collapsed stacks для flamegraph).
+- MemoryTracker: включает tracemalloc, запоминает базовый снимок и выдает
+  top-N разницу со вторым снимком, после чего выключает tracemalloc.
+- TaskTracker: на время сессии ставит task factory, которая запоминает
+  время создания каждой задачи, чтобы показать самые долгие задачи.
+- dump_tasks: количество задач asyncio по корутинам и по точкам ожидания,
+  самые долгие задачи, размеры хранилищ состояния и число открытых aiohttp-сессий.
+
+Пока профилирование не запущено, поток не создается, tracemalloc выключен
+и task factory не установлена, так что в обычной работе диагностика ничего не стоит.
+"""
+
+import gc
+import sys
+import time
+import asyncio
+import threading
+import tracemalloc
+import weakref
+from collections import Counter
+
+# Хранилища состояния, размер которых показывает dump_tasks: (модуль, атрибут)
+STATE_CONTAINERS = [
+    ("trainingbot.features.chatgpt", "user_contexts"),
+    ("trainingbot.features.currency", "user_currency_selection"),
+]
+
+# Минимальный интервал сэмплирования: при меньшем поток-сэмплер отнимает GIL у event loop
+MIN_INTERVAL = 0.001
+
+
+class DiagnosticsError(Exception):
+    """Команда диагностики не может быть выполнена в текущем состоянии."""
+
+
+class SamplingProfiler:
+    """Сэмплирующий профилировщик потока, в котором работает event loop."""
+
+    def __init__(self):
+        self._thread = None
+        self._stop = threading.Event()
+        self._stacks = Counter()
+        self._started = None
+        self.interval = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self, interval=0.005):
+        """Запускает сэмплирование текущего потока (вызывать из event loop)."""
+        if self.running:
+            raise DiagnosticsError("Профилирование уже запущено")
+        if not interval >= MIN_INTERVAL:
+            raise DiagnosticsError(f"Интервал сэмплирования должен быть не меньше {MIN_INTERVAL * 1000:.0f} мс")
+        self.interval = interval
+        self._stacks = Counter()
+        self._stop.clear()
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self._sample, args=(threading.get_ident(),),
+                                        name="cpu-profiler", daemon=True)
+        self._thread.start()
+
+    def _sample(self, target_id):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(target_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_filename}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self._stacks[";".join(reversed(stack))] += 1
+
+    def stop(self):
+        """Останавливает сэмплирование и возвращает (сводка, collapsed stacks)."""
+        if not self.running:
+            raise DiagnosticsError("Профилирование не запущено")
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        duration = time.monotonic() - self._started
+        total = sum(self._stacks.values())
+        # Собственное время функции - сколько раз она была на вершине стека
+        leaves = Counter()
+        for stack, count in self._stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        lines = [f"Длительность: {duration:.1f} с, сэмплов: {total}, интервал: {self.interval * 1000:.0f} мс"]
+        for leaf, count in leaves.most_common(10):
+            lines.append(f"{count * 100 / total:5.1f}%  {leaf}")
+        collapsed = "\n".join(f"{stack} {count}" for stack, count in self._stacks.most_common())
+        self._stacks = Counter()
+        return "\n".join(lines), collapsed
+
+
+class MemoryTracker:
+    """Разница распределений памяти между двумя снимками tracemalloc."""
+
+    def __init__(self):
+        self._baseline = None
+
+    @property
+    def running(self):
+        return self._baseline is not None
+
+    def start(self, frames=10):
+        """Включает tracemalloc и делает базовый снимок."""
+        if self.running:
+            raise DiagnosticsError("Снимок памяти уже сделан, ожидается второй")
+        tracemalloc.start(frames)
+        self._baseline = tracemalloc.take_snapshot()
+
+    def diff(self, top_n=20):
+        """Делает второй снимок, выключает tracemalloc и возвращает top-N разницу."""
+        if not self.running:
+            raise DiagnosticsError("Сначала нужен базовый снимок памяти")
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        baseline, self._baseline = self._baseline, None
+        # Распределения самого tracemalloc не интересны
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        stats = snapshot.filter_traces(filters).compare_to(baseline.filter_traces(filters), "traceback")
+        lines = [f"Отслеживается: {current / 1024:.0f} КБ, пик: {peak / 1024:.0f} КБ", ""]
+        for index, stat in enumerate(stats[:top_n], 1):
+            lines.append(f"#{index}: {stat.size_diff / 1024:+.1f} КБ ({stat.count_diff:+d} блоков), "
+                         f"всего {stat.size / 1024:.1f} КБ")
+            lines.extend(f"    {line}" for line in stat.traceback.format())
+        return "\n".join(lines)
+
+
+class TaskTracker:
+    """Запоминает время создания задач asyncio, пока сессия отслеживания активна."""
+
+    def __init__(self):
+        self._loop = None
+        self._previous_factory = None
+        # Задача -> (время создания, True если время точное)
+        self._created = weakref.WeakKeyDictionary()
+        self._started = None
+
+    @property
+    def running(self):
+        return self._loop is not None
+
+    def start(self):
+        """Ставит task factory на текущий event loop."""
+        if self.running:
+            raise DiagnosticsError("Отслеживание задач уже запущено")
+        self._loop = asyncio.get_running_loop()
+        self._previous_factory = self._loop.get_task_factory()
+        self._started = time.monotonic()
+        # Для уже существующих задач время создания неизвестно - отсчитываем от начала сессии
+        for task in asyncio.all_tasks(self._loop):
+            self._created[task] = (self._started, False)
+        self._loop.set_task_factory(self._factory)
+
+    def _factory(self, loop, coro, **kwargs):
+        if self._previous_factory is not None:
+            task = self._previous_factory(loop, coro, **kwargs)
+        else:
+            task = asyncio.Task(coro, loop=loop, **kwargs)
+        self._created[task] = (time.monotonic(), True)
+        return task
+
+    def stop(self):
+        """Возвращает прежнюю task factory и забывает собранные данные."""
+        if not self.running:
+            raise DiagnosticsError("Отслеживание задач не запущено")
+        if self._loop.get_task_factory() == self._factory:
+            self._loop.set_task_factory(self._previous_factory)
+        self._loop = None
+        self._previous_factory = None
+        self._created = weakref.WeakKeyDictionary()
+
+    def oldest(self, tasks, top_n):
+        """Возвращает top-N самых старых задач: (возраст, точный ли возраст, задача)."""
+        now = time.monotonic()
+        known = [(now - self._created[task][0], self._created[task][1], task)
+                 for task in tasks if task in self._created]
+        known.sort(key=lambda item: item[0], reverse=True)
+        return known[:top_n]
+
+
+def _task_name(task):
+    coro = task.get_coro()
+    return getattr(coro, "__qualname__", None) or repr(coro)
+
+
+def _suspension_point(task):
+    """Место, где задача сейчас ожидает (самый внутренний кадр стека)."""
+    stack = task.get_stack()
+    if not stack:
+        return "не запущена"
+    frame = stack[-1]
+    return f"{frame.f_code.co_filename}:{frame.f_lineno} {frame.f_code.co_name}"
+
+
+def dump_tasks(top_n=20):
+    """Возвращает отчет о задачах asyncio и размерах хранилищ состояния."""
+    tasks = [task for task in asyncio.all_tasks() if not task.done()]
+    counts = Counter(_task_name(task) for task in tasks)
+    lines = [f"Задач asyncio: {len(tasks)}", ""]
+    lines.extend(f"{count:6d}  {name}" for name, count in counts.most_common())
+
+    # asyncio не хранит время создания задачи, поэтому показываем, где задачи сейчас ждут
+    points = Counter((_task_name(task), _suspension_point(task)) for task in tasks)
+    lines += ["", f"Точки ожидания задач, top {top_n}:"]
+    for (name, point), count in points.most_common(top_n):
+        lines.append(f"{count:6d}  {name}  {point}")
+
+    lines += ["", f"Самые долгие задачи, top {top_n}:"]
+    if task_tracker.running:
+        for age, exact, task in task_tracker.oldest(tasks, top_n):
+            # ">=" - задача создана до начала отслеживания, возраст не меньше указанного
+            age_text = f"{age:.1f} с" if exact else f">={age:.1f} с"
+            lines.append(f"{age_text:>12}  {task.get_name()}  {_task_name(task)}  {_suspension_point(task)}")
+    else:
+        lines.append("    отслеживание выключено, включите /tasks_start (или /tasks/start по HTTP)")
+
+    lines += ["", "Хранилища состояния:"]
+    for module_name, attr in STATE_CONTAINERS:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            lines.append(f"{len(getattr(module, attr)):9d}  {module_name}.{attr}")
+
+    aiohttp = sys.modules.get("aiohttp")
+    if aiohttp is not None:
+        sessions = [obj for obj in gc.get_objects() if isinstance(obj, aiohttp.ClientSession)]
+        opened = sum(1 for session in sessions if not session.closed)
+        lines.append(f"{opened:9d}  открытых aiohttp.ClientSession (всего объектов: {len(sessions)})")
+    return "\n".join(lines)
+
+
+# Общие экземпляры для команд бота и HTTP-эндпоинта
+cpu_profiler = SamplingProfiler()
+memory_tracker = MemoryTracker()
+task_tracker = TaskTracker()
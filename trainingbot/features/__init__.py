@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+Модули-функции бота. Каждый модуль экспортирует router и список commands
+(BotCommand для меню бота) и подключается в trainingbot.app по имени.
+Зависимости, которые не нужны самому aiogram (например, httpx),
+импортируются внутри хендлеров при первом использовании функции.
+"""
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Команды диагностики для администраторов (ADMIN_IDS через запятую в .env):
+/profile_start [интервал в мс], /profile_stop, /mem_start, /mem_diff [N],
+/tasks_start, /tasks_stop (отслеживание времени создания задач), /tasks.
+
+Если задан DIAGNOSTICS_PORT, те же функции доступны по HTTP на 127.0.0.1:
+/profile/start?interval_ms=5, /profile/stop, /memory/start, /memory/diff?top=20,
+/tasks/start, /tasks/stop, /tasks.
+Результаты возвращаются файлами.
+"""
+
+import os
+import logging
+from aiogram import Router, F
+from aiogram.types import Message, BufferedInputFile
+from aiogram.filters import Command, CommandObject
+from trainingbot.diagnostics import DiagnosticsError, cpu_profiler, memory_tracker, task_tracker, dump_tasks
+
+logger = logging.getLogger(__name__)
+
+router = Router(name=__name__)
+
+# Команды администратора не показываются в общем меню бота
+commands = []
+
+ADMIN_IDS = {int(user_id) for user_id in os.getenv("ADMIN_IDS", "").split(",") if user_id.strip()}
+DIAGNOSTICS_PORT = os.getenv("DIAGNOSTICS_PORT")  # Порт локального HTTP-эндпоинта
+
+# Хендлеры модуля срабатывают только для администраторов
+router.message.filter(F.from_user.id.in_(ADMIN_IDS))
+
+_web_runner = None
+
+
+def parse_int(value, default):
+    try:
+        return int(value) if value else default
+    except ValueError:
+        return default
+
+
+def as_file(text, filename):
+    return BufferedInputFile(text.encode("utf-8"), filename=filename)
+
+
+@router.message(Command("profile_start"))
+async def profile_start(message: Message, command: CommandObject):
+    interval_ms = parse_int(command.args, 5)
+    try:
+        cpu_profiler.start(interval_ms / 1000)
+    except DiagnosticsError as e:
+        await message.answer(f"❌ {e}")
+        return
+    logger.info(f"Администратор {message.from_user.id} запустил профилирование")
+    await message.answer(f"✅ Профилирование запущено, интервал {interval_ms} мс. Остановить: /profile_stop")
+
+
+@router.message(Command("profile_stop"))
+async def profile_stop(message: Message):
+    try:
+        summary, collapsed = cpu_profiler.stop()
+    except DiagnosticsError as e:
+        await message.answer(f"❌ {e}")
+        return
+    # Пустой файл Telegram не принимает - если сэмплов нет, отправляем только сводку
+    if not collapsed:
+        await message.answer(summary)
+        return
+    # Подпись к файлу в Telegram ограничена 1024 символами
+    await message.answer_document(as_file(collapsed, "cpu_profile.collapsed.txt"), caption=summary[:1024])
+
+
+@router.message(Command("mem_start"))
+async def mem_start(message: Message):
+    try:
+        memory_tracker.start()
+    except DiagnosticsError as e:
+        await message.answer(f"❌ {e}")
+        return
+    logger.info(f"Администратор {message.from_user.id} включил tracemalloc")
+    await message.answer("✅ Базовый снимок памяти сделан. Сравнить: /mem_diff")
+
+
+@router.message(Command("mem_diff"))
+async def mem_diff(message: Message, command: CommandObject):
+    try:
+        report = memory_tracker.diff(parse_int(command.args, 20))
+    except DiagnosticsError as e:
+        await message.answer(f"❌ {e}")
+        return
+    await message.answer_document(as_file(report, "memory_diff.txt"))
+
+
+@router.message(Command("tasks_start"))
+async def tasks_start(message: Message):
+    try:
+        task_tracker.start()
+    except DiagnosticsError as e:
+        await message.answer(f"❌ {e}")
+        return
+    logger.info(f"Администратор {message.from_user.id} включил отслеживание задач")
+    await message.answer("✅ Отслеживание задач включено. Отчет: /tasks, выключить: /tasks_stop")
+
+
+@router.message(Command("tasks_stop"))
+async def tasks_stop(message: Message):
+    try:
+        task_tracker.stop()
+    except DiagnosticsError as e:
+        await message.answer(f"❌ {e}")
+        return
+    await message.answer("✅ Отслеживание задач выключено")
+
+
+@router.message(Command("tasks"))
+async def tasks(message: Message):
+    await message.answer_document(as_file(dump_tasks(), "asyncio_tasks.txt"))
+
+
+async def start_web_server():
+    """Запускает локальный HTTP-эндпоинт диагностики."""
+    from aiohttp import web  # Импортируем, только если эндпоинт включен
+
+    def text_response(text, filename=None, status=200):
+        headers = {"Content-Disposition": f'attachment; filename="{filename}"'} if filename else None
+        return web.Response(text=text, status=status, headers=headers)
+
+    async def handle(request):
+        action = request.match_info["action"]
+        try:
+            if action == "profile/start":
+                cpu_profiler.start(parse_int(request.query.get("interval_ms"), 5) / 1000)
+                return text_response("Профилирование запущено\n")
+            if action == "profile/stop":
+                summary, collapsed = cpu_profiler.stop()
+                logger.info(summary)
+                if not collapsed:
+                    return text_response(f"{summary}\n")
+                return text_response(collapsed, "cpu_profile.collapsed.txt")
+            if action == "memory/start":
+                memory_tracker.start()
+                return text_response("Базовый снимок памяти сделан\n")
+            if action == "memory/diff":
+                return text_response(memory_tracker.diff(parse_int(request.query.get("top"), 20)), "memory_diff.txt")
+            if action == "tasks/start":
+                task_tracker.start()
+                return text_response("Отслеживание задач включено\n")
+            if action == "tasks/stop":
+                task_tracker.stop()
+                return text_response("Отслеживание задач выключено\n")
+            if action == "tasks":
+                return text_response(dump_tasks(), "asyncio_tasks.txt")
+        except DiagnosticsError as e:
+            return text_response(f"{e}\n", status=409)
+        return text_response("Неизвестная команда\n", status=404)
+
+    global _web_runner
+    app = web.Application()
+    app.router.add_get("/{action:.+}", handle)
+    _web_runner = web.AppRunner(app)
+    await _web_runner.setup()
+    # Слушаем только localhost: эндпоинт не должен быть доступен снаружи
+    await web.TCPSite(_web_runner, "127.0.0.1", int(DIAGNOSTICS_PORT)).start()
+    logger.info(f"Эндпоинт диагностики: http://127.0.0.1:{DIAGNOSTICS_PORT}/")
+
+
+@router.startup()
+async def on_startup():
+    if DIAGNOSTICS_PORT:
+        await start_web_server()
+
+
+@router.shutdown()
+async def on_shutdown():
+    if _web_runner is not None:
+        await _web_runner.cleanup()
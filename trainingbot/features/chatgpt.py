@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Ответы ChatGPT на текстовые и голосовые сообщения (из chatgpt_excample.py).
+Подключается последним: обрабатывает все сообщения, не попавшие в другие модули.
+"""
+
+import os
+import logging
+from aiogram import Bot, Router, F
+from aiogram.types import Message
+from aiogram.enums.parse_mode import ParseMode
+
+logger = logging.getLogger(__name__)
+
+router = Router(name=__name__)
+
+commands = []
+
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+# Настройки OpenAI API
+API_URL = "https://api.openai.com/v1/chat/completions"
+WHISPER_API_URL = "https://api.openai.com/v1/audio/transcriptions"
+SYSTEM_PROMPT = "Ты умный Telegram-бот, который помогает людям отвечать на вопросы."
+
+# Хранилище контекста диалогов пользователей
+user_contexts = {}
+
+
+async def transcribe_voice(voice_file: bytes):
+    """Отправляет голосовое сообщение в OpenAI Whisper для транскрибации."""
+    import httpx  # Импортируем при первом использовании
+
+    files = {"file": ("audio.ogg", voice_file, "audio/ogg")}
+    data = {"model": "whisper-1"}
+    headers = {"Authorization": f"Bearer {OPENAI_API_KEY}"}
+
+    try:
+        async with httpx.AsyncClient(timeout=15) as client:
+            response = await client.post(WHISPER_API_URL, headers=headers, data=data, files=files)
+            response.raise_for_status()
+            transcription = response.json()["text"]
+            logger.info(f"Транскрибация выполнена: {transcription}")
+            return transcription
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Ошибка API Whisper: {e.response.text}")
+        return "Ошибка при распознавании аудио. Попробуйте позже."
+    except Exception as e:
+        logger.error(f"Ошибка: {str(e)}")
+        return "Произошла непредвиденная ошибка. Попробуйте позже."
+
+
+async def ask_chatgpt(user_id: int, message: str):
+    """Отправляет сообщение в OpenAI API и возвращает ответ."""
+    import httpx  # Импортируем при первом использовании
+
+    logger.info(f"Пользователь {user_id} отправил сообщение: {message}")
+    context = user_contexts.get(user_id, [])
+    context.append({"role": "user", "content": message})
+
+    payload = {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "system", "content": SYSTEM_PROMPT}] + context,
+        "max_tokens": 400
+    }
+    headers = {"Authorization": f"Bearer {OPENAI_API_KEY}"}
+
+    try:
+        async with httpx.AsyncClient(timeout=15) as client:
+            response = await client.post(API_URL, json=payload, headers=headers)
+            response.raise_for_status()
+            reply = response.json()["choices"][0]["message"]["content"]
+            context.append({"role": "assistant", "content": reply})
+            user_contexts[user_id] = context[-10:]  # Ограничиваем длину контекста
+            logger.info(f"Ответ от ChatGPT для пользователя {user_id}: {reply}")
+            return reply
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Ошибка API OpenAI: {e.response.text}")
+        return "Ошибка при обращении к ChatGPT. Попробуйте позже."
+    except Exception as e:
+        logger.error(f"Ошибка: {str(e)}")
+        return "Произошла непредвиденная ошибка. Попробуйте позже."
+
+
+@router.message(F.voice)
+async def handle_voice_message(message: Message, bot: Bot):
+    """Обрабатывает голосовые сообщения."""
+    user_id = message.from_user.id
+    voice_file = await bot.download(message.voice.file_id)
+    voice_bytes = voice_file.getvalue()
+
+    logger.info(f"Пользователь {user_id} отправил голосовое сообщение.")
+    await message.answer("🎙 Распознаю голосовое сообщение...")
+    transcribed_text = await transcribe_voice(voice_bytes)
+    if transcribed_text.startswith("Ошибка"):
+        await message.answer(transcribed_text)
+        return
+
+    await message.answer(f"✍️ Распознанный текст: {transcribed_text}")
+    response = await ask_chatgpt(user_id, transcribed_text)
+    await message.answer(response, parse_mode=ParseMode.MARKDOWN)
+
+
+@router.message(F.text)
+async def handle_message(message: Message):
+    """Обрабатывает входящие текстовые сообщения."""
+    user_id = message.from_user.id
+    text = message.text.strip()
+
+    if not text:
+        logger.warning(f"Пользователь {user_id} отправил пустое сообщение.")
+        await message.answer("Пожалуйста, отправьте текстовое сообщение.")
+        return
+
+    await message.answer("⏳ Думаю...")
+    response = await ask_chatgpt(user_id, text)
+    await message.answer(response)
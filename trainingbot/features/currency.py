@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Задание 6: команда /currency - курс выбранной пары валют."""
+
+import asyncio
+import logging
+import aiohttp
+from aiogram import Router, F
+from aiogram.types import Message, CallbackQuery, BotCommand, InlineKeyboardMarkup, InlineKeyboardButton
+from aiogram.filters import Command
+
+logger = logging.getLogger(__name__)
+
+router = Router(name=__name__)
+
+commands = [
+    BotCommand(command="currency", description="Узнать курс валют"),
+]
+
+# URL API для получения курса валют
+CURRENCY_API_URL = "https://api.exchangerate-api.com/v4/latest/"
+CURRENCIES = [["USD", "EUR", "RUB"], ["GBP", "JPY", "AUD"]]
+
+# Словарь для хранения выбора пользователя
+user_currency_selection = {}
+
+
+def currency_keyboard(prefix):
+    """Клавиатура выбора валюты с callback_data вида <prefix><валюта>."""
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text=currency, callback_data=f"{prefix}{currency}") for currency in row]
+        for row in CURRENCIES
+    ])
+
+
+# Обработчик команды /currency - предлагает пользователю выбрать две валюты
+@router.message(Command("currency"))
+async def currency_rate(message: Message):
+    await message.answer("Выберите первую валюту:", reply_markup=currency_keyboard("currency_"))
+
+
+# Обработчик callback-запросов для выбора первой валюты
+@router.callback_query(F.data.startswith("currency_"))
+async def select_first_currency(callback_query: CallbackQuery):
+    base_currency = callback_query.data.split("_")[1]
+    user_currency_selection[callback_query.from_user.id] = {"base": base_currency}
+    await callback_query.answer()
+    await callback_query.message.answer("Теперь выберите вторую валюту:",
+                                        reply_markup=currency_keyboard(f"target_{base_currency}_"))
+
+
+# Обработчик выбора второй валюты и получения курса
+@router.callback_query(F.data.startswith("target_"))
+async def process_currency_callback(callback_query: CallbackQuery):
+    _, base_currency, target_currency = callback_query.data.split("_")
+    await callback_query.answer()
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"{CURRENCY_API_URL}{base_currency}", timeout=10) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    rate = data["rates"].get(target_currency)
+                    if rate:
+                        await callback_query.message.answer(f"💰 Курс {base_currency} → {target_currency}: {rate}")
+                    else:
+                        await callback_query.message.answer("❌ Не удалось получить курс валют.")
+                else:
+                    await callback_query.message.answer("❌ Ошибка при получении данных с сервера.")
+    except aiohttp.ClientError as e:
+        logger.error(f"Ошибка сети: {e}")
+        await callback_query.message.answer("❌ Ошибка сети при получении данных.")
+    except asyncio.TimeoutError:
+        logger.error("Таймаут запроса при загрузке данных.")
+        await callback_query.message.answer("❌ Время ожидания ответа истекло.")
+    except Exception as e:
+        logger.error(f"Неизвестная ошибка: {e}")
+        await callback_query.message.answer("❌ Произошла неизвестная ошибка.")
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Задание 3: команда /random_pic - случайное изображение."""
+
+import asyncio
+import logging
+import aiohttp
+from aiogram import Router
+from aiogram.types import Message, BotCommand
+from aiogram.filters import Command
+
+logger = logging.getLogger(__name__)
+
+router = Router(name=__name__)
+
+commands = [
+    BotCommand(command="random_pic", description="Получить случайную картинку 800 на 600"),
+]
+
+PICTURE_URL = "https://picsum.photos/800/600"  # URL для получения случайного изображения
+
+
+# Обработчик команды /random_pic - отправляет случайное изображение пользователю
+@router.message(Command("random_pic"))
+async def random_pic(message: Message):
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(PICTURE_URL, timeout=10) as response:  # Выполняем GET-запрос с таймаутом
+                if response.status == 200:
+                    await message.answer_photo(str(response.url), caption="🎲 Случайное изображение!")
+                else:
+                    await message.answer("❌ Не удалось загрузить изображение.")
+    except aiohttp.ClientError as e:
+        logger.error(f"Ошибка сети: {e}")
+        await message.answer("❌ Ошибка сети при получении изображения.")
+    except asyncio.TimeoutError:
+        logger.error("Таймаут запроса при загрузке изображения.")
+        await message.answer("❌ Время ожидания ответа истекло.")
+    except Exception as e:
+        logger.error(f"Неизвестная ошибка загрузки изображения: {e}")
+        await message.answer("❌ Произошла неизвестная ошибка при получении изображения.")
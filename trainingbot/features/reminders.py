@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Дополнительная идея 1: команда /set_reminder - напоминание через заданное время."""
+
+import os
+import re
+import asyncio
+import logging
+from functools import partial
+from aiogram import Bot, Router
+from aiogram.exceptions import TelegramRetryAfter, TelegramNetworkError, TelegramServerError
+from aiogram.types import Message, BotCommand
+from aiogram.filters import Command, CommandObject
+
+logger = logging.getLogger(__name__)
+
+router = Router(name=__name__)
+
+commands = [
+    BotCommand(command="set_reminder", description="Создать напоминание: /set_reminder 10m текст"),
+]
+
+REMINDERS_DB = os.getenv("REMINDERS_DB", "reminders.db")  # Файл базы напоминаний
+
+# Telegram разрешает боту около 30 сообщений в секунду
+SEND_RATE = 30
+# Через сколько секунд повторить отправку после сетевой ошибки или ошибки сервера
+RETRY_DELAY = 10
+
+# Единицы времени для команды /set_reminder
+TIME_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+DELAY_PATTERN = re.compile(r"^(\d+)([smhd]?)$")
+# Максимальная задержка напоминания - 5 лет
+MAX_DELAY = 5 * 365 * TIME_UNITS["d"]
+
+# Планировщик создается при первом использовании (или при запуске, если в базе есть напоминания)
+_scheduler = None
+_scheduler_task = None
+
+
+async def send_reminders(bot: Bot, batch):
+    """Отправляет пачку напоминаний (темп задает планировщик).
+
+    Возвращает список (id, задержка) для временных ошибок, которые нужно повторить.
+    Остальные ошибки (бот заблокирован, чат не найден) постоянные - такие напоминания отбрасываются.
+    """
+    results = await asyncio.gather(
+        *(bot.send_message(chat_id, f"⏰ Напоминание: {text}") for _, chat_id, text in batch),
+        return_exceptions=True,
+    )
+    retry = []
+    for (reminder_id, chat_id, _), result in zip(batch, results):
+        if isinstance(result, TelegramRetryAfter):
+            delay = result.retry_after
+        elif isinstance(result, (TelegramNetworkError, TelegramServerError, asyncio.TimeoutError)):
+            delay = RETRY_DELAY
+        else:
+            if isinstance(result, Exception):
+                logger.error(f"Не удалось отправить напоминание {reminder_id} в чат {chat_id}: {result}")
+            continue
+        logger.warning(f"Напоминание {reminder_id} в чат {chat_id} будет отправлено повторно через {delay} с: {result}")
+        retry.append((reminder_id, delay))
+    return retry
+
+
+def get_scheduler(bot: Bot):
+    """Возвращает планировщик, при первом вызове создает его и запускает цикл."""
+    global _scheduler, _scheduler_task
+    if _scheduler is None:
+        from trainingbot.reminders import ReminderScheduler
+        # Доставленные напоминания удаляются из базы примерно каждые 10 секунд отправки
+        _scheduler = ReminderScheduler(REMINDERS_DB, partial(send_reminders, bot),
+                                       batch_size=SEND_RATE * 10, send_rate=SEND_RATE)
+        _scheduler_task = asyncio.create_task(_scheduler.run())
+    return _scheduler
+
+
+@router.startup()
+async def on_startup(bot: Bot):
+    # Если в базе остались напоминания, их нужно доставить и без новых команд
+    if os.path.exists(REMINDERS_DB):
+        get_scheduler(bot)
+
+
+@router.shutdown()
+async def on_shutdown():
+    if _scheduler_task is not None:
+        _scheduler_task.cancel()
+
+
+def parse_delay(value: str):
+    """Переводит строку вида 30s, 10m, 2h, 1d (или просто секунды) в секунды.
+
+    Возвращает None для неверной строки и для задержки больше MAX_DELAY.
+    """
+    match = DELAY_PATTERN.match(value.lower())
+    if not match:
+        return None
+    amount, unit = match.groups()
+    delay = int(amount) * TIME_UNITS[unit or "s"]
+    return delay if delay <= MAX_DELAY else None
+
+
+# Обработчик команды /set_reminder <время> <текст>
+@router.message(Command("set_reminder"))
+async def set_reminder(message: Message, command: CommandObject, bot: Bot):
+    parts = (command.args or "").split(maxsplit=1)
+    delay = parse_delay(parts[0]) if parts else None
+    if delay is None or len(parts) < 2:
+        await message.answer("Использование: /set_reminder 10m Текст напоминания\n"
+                             "Единицы времени: s - секунды, m - минуты, h - часы, d - дни\n"
+                             "Максимальная задержка - 5 лет")
+        return
+    await get_scheduler(bot).add(message.chat.id, delay, parts[1])
+    logger.info(f"Пользователь {message.from_user.id} создал напоминание через {delay} с")
+    await message.answer(f"✅ Напомню через {parts[0]}")
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Задания 2, 4, 5: команды /start, /info, /menu и inline-кнопки."""
+
+from aiogram import Router, F
+from aiogram.types import (Message, CallbackQuery, BotCommand, InlineKeyboardMarkup, InlineKeyboardButton,
+                           ReplyKeyboardMarkup, KeyboardButton)
+from aiogram.enums.parse_mode import ParseMode
+from aiogram.filters import Command
+
+router = Router(name=__name__)
+
+commands = [
+    BotCommand(command="start", description="Запустить бота"),
+    BotCommand(command="info", description="Список доступных команд"),
+    BotCommand(command="menu", description="Показать клавиатуру с командами"),
+]
+
+inline_kb = InlineKeyboardMarkup(inline_keyboard=[
+    [InlineKeyboardButton(text="Перейти на сайт", url="https://example.com")],
+    [InlineKeyboardButton(text="Получить больше информации", callback_data="more_info")]
+])
+
+
+# Обработчик команды /start - приветствует пользователя и показывает inline-кнопки
+@router.message(Command("start"))
+async def start(message: Message):
+    text = """*Данные получены!*
+_Здравствуйте!_"""  # Сообщение пользователю с использованием Markdown
+    await message.answer(text, parse_mode=ParseMode.MARKDOWN, reply_markup=inline_kb)
+
+
+# Обработчик команды /info - список команд собирается из подключенных модулей
+@router.message(Command("info"))
+async def info(message: Message, bot_commands: list):
+    lines = [f"<i>/{command.command}</i> - {command.description}" for command in bot_commands]
+    await message.answer("<b>Доступные команды:</b>\n\n" + "\n".join(lines), parse_mode=ParseMode.HTML)
+
+
+# Обработчик команды /menu - показывает клавиатуру с командами (по две в строке)
+@router.message(Command("menu"))
+async def menu(message: Message, bot_commands: list):
+    buttons = [KeyboardButton(text=f"/{command.command}") for command in bot_commands]
+    keyboard = ReplyKeyboardMarkup(keyboard=[buttons[i:i + 2] for i in range(0, len(buttons), 2)],
+                                   resize_keyboard=True)
+    await message.answer("Выберите команду:", reply_markup=keyboard)
+
+
+@router.callback_query(F.data == "more_info")
+async def more_info(callback_query: CallbackQuery):
+    await callback_query.answer()
+    await callback_query.message.answer("Вот дополнительная информация!")
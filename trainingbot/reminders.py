@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Планировщик напоминаний для команды /set_reminder (дополнительная идея 1).
+
+Вместо отдельной задачи asyncio.sleep на каждое напоминание используется
+один цикл планировщика и min-heap. Все напоминания хранятся в SQLite,
+а в памяти держится только ближайшее окно (по умолчанию 10 минут),
+поэтому миллион отложенных напоминаний почти не занимает памяти.
+"""
+
+import asyncio
+import heapq
+import math
+import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Размер окна, которое держится в памяти (в секундах)
+DEFAULT_WINDOW = 600
+# Сколько напоминаний отправляется и удаляется из базы за одну транзакцию
+DEFAULT_BATCH_SIZE = 300
+# Максимальная пауза перед повтором после ошибки базы (в секундах)
+MAX_RETRY_DELAY = 60
+# Через сколько секунд повторить пачку, если send_batch упал целиком
+SEND_RETRY_DELAY = 5
+
+
+class ReminderScheduler:
+    """Хранит напоминания в SQLite и доставляет их пачками через send_batch."""
+
+    def __init__(self, db_path, send_batch, window=DEFAULT_WINDOW, batch_size=DEFAULT_BATCH_SIZE, send_rate=None):
+        self.db_path = db_path
+        # send_batch(reminders) - корутина, получает список кортежей (id, chat_id, text)
+        # и возвращает список (id, через сколько секунд повторить) для временных ошибок;
+        # остальные напоминания считаются доставленными (или отброшенными) и удаляются
+        self.send_batch = send_batch
+        self.window = window
+        self.batch_size = batch_size
+        # Лимит сообщений в секунду для всех вызовов send_batch; None - без ограничения
+        self.send_rate = send_rate
+        self._next_send = 0.0
+        # Куча кортежей (due, id, chat_id, text) только для ближайшего окна
+        self._heap = []
+        # id напоминаний, которые уже загружены в кучу (защита от дублей при подгрузке)
+        self._pending_ids = set()
+        # Верхняя граница загруженного окна; None - окно еще не загружалось
+        self._horizon = None
+        self._wakeup = asyncio.Event()
+        # Все обращения к SQLite выполняются последовательно в одном потоке
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reminders-db")
+        self._conn = None
+
+    async def _db(self, func, *args):
+        """Выполняет функцию работы с базой в потоке планировщика."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, func, args)
+
+    def _call(self, func, args):
+        # Соединение открывается лениво в потоке базы при первом обращении
+        if self._conn is None:
+            self._open()
+        return func(*args)
+
+    def _open(self):
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS reminders ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "due INTEGER NOT NULL, "
+            "chat_id INTEGER NOT NULL, "
+            "text TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS reminders_due ON reminders (due)")
+        self._conn.commit()
+
+    def _insert(self, due, chat_id, text):
+        cursor = self._conn.execute(
+            "INSERT INTO reminders (due, chat_id, text) VALUES (?, ?, ?)", (due, chat_id, text)
+        )
+        self._conn.commit()
+        return cursor.lastrowid
+
+    def _select_window(self, low, high):
+        # При первой загрузке нижней границы нет - подхватываем и просроченные напоминания
+        if low is None:
+            return self._conn.execute(
+                "SELECT due, id, chat_id, text FROM reminders WHERE due < ?", (high,)
+            ).fetchall()
+        return self._conn.execute(
+            "SELECT due, id, chat_id, text FROM reminders WHERE due >= ? AND due < ?", (low, high)
+        ).fetchall()
+
+    def _delete(self, ids):
+        self._conn.executemany("DELETE FROM reminders WHERE id = ?", [(i,) for i in ids])
+        self._conn.commit()
+
+    def _count(self):
+        return self._conn.execute("SELECT COUNT(*) FROM reminders").fetchone()[0]
+
+    async def count(self):
+        """Возвращает количество отложенных напоминаний в базе."""
+        return await self._db(self._count)
+
+    async def add(self, chat_id, delay, text):
+        """Сохраняет напоминание, которое нужно отправить через delay секунд."""
+        # Округляем вверх, чтобы напоминание не сработало раньше запрошенного времени
+        due = math.ceil(time.time() + delay)
+        reminder_id = await self._db(self._insert, due, chat_id, text)
+        # В кучу попадают только напоминания из загруженного окна, остальные подгрузятся позже
+        if self._horizon is not None and due < self._horizon and reminder_id not in self._pending_ids:
+            self._push((due, reminder_id, chat_id, text))
+            if self._heap[0][1] == reminder_id:
+                self._wakeup.set()  # Новое напоминание раньше текущего - будим цикл
+        return reminder_id
+
+    def _push(self, item):
+        heapq.heappush(self._heap, item)
+        self._pending_ids.add(item[1])
+
+    async def _refill(self, now):
+        """Подгружает из базы следующее окно напоминаний."""
+        low = self._horizon
+        # Сдвигаем границу до запроса, чтобы новые напоминания сразу шли в кучу
+        self._horizon = int(now) + self.window
+        try:
+            rows = await self._db(self._select_window, low, self._horizon)
+        except Exception:
+            # Окно не загружено - при повторе запрашиваем его с прежней границы
+            self._horizon = low
+            raise
+        for row in rows:
+            if row[1] not in self._pending_ids:
+                self._push(row)
+        logger.info(f"Загружено напоминаний в окно: {len(rows)}, в памяти: {len(self._heap)}")
+
+    def _pop_due(self, now):
+        """Забирает из кучи не больше batch_size напоминаний, срок которых наступил."""
+        batch = []
+        while self._heap and self._heap[0][0] <= now and len(batch) < self.batch_size:
+            due, reminder_id, chat_id, text = heapq.heappop(self._heap)
+            self._pending_ids.discard(reminder_id)
+            batch.append((reminder_id, chat_id, text))
+        return batch
+
+    async def _throttle(self, count):
+        """Ждет, чтобы отправка count сообщений не превысила send_rate с учетом прошлых пачек."""
+        if not self.send_rate:
+            return
+        now = time.monotonic()
+        if self._next_send > now:
+            await asyncio.sleep(self._next_send - now)
+            now = self._next_send
+        self._next_send = now + count / self.send_rate
+
+    async def _deliver(self, batch):
+        retry = {}
+        step = self.send_rate or len(batch)
+        for i in range(0, len(batch), step):
+            chunk = batch[i:i + step]
+            await self._throttle(len(chunk))
+            try:
+                retry.update(await self.send_batch(chunk) or [])
+            except Exception as e:
+                logger.error(f"Ошибка отправки пачки напоминаний: {e}")
+                retry.update((item[0], SEND_RETRY_DELAY) for item in chunk)
+        # Удаляем доставленные напоминания одной транзакцией
+        await self._db(self._delete, [item[0] for item in batch if item[0] not in retry])
+        # Временные ошибки (429, сеть) - возвращаем напоминания в кучу с отсрочкой.
+        # В базе остается прежний срок, поэтому после перезапуска они отправятся сразу
+        now = time.time()
+        for reminder_id, chat_id, text in batch:
+            if reminder_id in retry:
+                self._push((math.ceil(now + retry[reminder_id]), reminder_id, chat_id, text))
+        if retry:
+            logger.warning(f"Напоминаний отложено для повторной отправки: {len(retry)}")
+
+    async def run(self):
+        """Основной цикл планировщика - один на все напоминания."""
+        retry_delay = 1
+        try:
+            while True:
+                try:
+                    await self._step()
+                    retry_delay = 1
+                except Exception as e:
+                    # Ошибка базы не должна останавливать единственный цикл планировщика
+                    logger.error(f"Ошибка планировщика напоминаний, повтор через {retry_delay} с: {e}")
+                    await asyncio.sleep(retry_delay)
+                    retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY)
+        finally:
+            self._executor.submit(self._close)
+            self._executor.shutdown(wait=False)
+
+    async def _step(self):
+        """Одна итерация цикла: загрузка окна, отправка пачки или ожидание."""
+        now = time.time()
+        if self._horizon is None:
+            await self._refill(now)
+            return
+        batch = self._pop_due(now)
+        if batch:
+            await self._deliver(batch)
+            return
+        # Подгружаем следующее окно, когда прошла половина текущего
+        if now >= self._horizon - self.window / 2:
+            await self._refill(now)
+            return
+        timeout = self._horizon - self.window / 2 - now
+        if self._heap:
+            timeout = min(timeout, self._heap[0][0] - now)
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=max(timeout, 0))
+        except asyncio.TimeoutError:
+            pass
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Отчет о времени запуска бота.
+
+Каждый этап запуска (импорт зависимостей, создание бота, импорт и подключение
+модулей-функций) оборачивается в profiler.step(). Память оценивается по приросту
+числа выделенных блоков (sys.getallocatedblocks), а не через tracemalloc,
+чтобы не искажать замер времени. Если профилирование выключено, шаги ничего не замеряют.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Замеряет время, прирост выделенных блоков памяти и число импортированных модулей по этапам."""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.steps = []  # Кортежи (этап, секунды, блоки памяти, новые модули)
+        self._started = time.perf_counter()
+        self._blocks_started = sys.getallocatedblocks()
+
+    @contextmanager
+    def step(self, name):
+        if not self.enabled:
+            yield
+            return
+        modules_before = set(sys.modules)
+        blocks_before = sys.getallocatedblocks()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            blocks = sys.getallocatedblocks() - blocks_before
+            new_modules = set(sys.modules) - modules_before
+            self.steps.append((name, elapsed, blocks, new_modules))
+
+    def report(self):
+        """Возвращает текст отчета."""
+        if not self.enabled:
+            return ""
+        total = time.perf_counter() - self._started
+        total_blocks = sys.getallocatedblocks() - self._blocks_started
+        lines = ["Отчет о запуске бота:",
+                 f"{'Этап':<36}{'мс':>9}{'блоков':>10}{'модулей':>9}  пакеты"]
+        for name, elapsed, blocks, new_modules in self.steps:
+            # Показываем только пакеты верхнего уровня, которые подтянул этап
+            packages = sorted({module.split(".")[0] for module in new_modules})
+            shown = ", ".join(packages[:8]) + (" ..." if len(packages) > 8 else "")
+            lines.append(f"{name:<36}{elapsed * 1000:>9.1f}{blocks:>10}{len(new_modules):>9}  {shown}")
+        lines.append(f"{'Всего':<36}{total * 1000:>9.1f}{total_blocks:>10}")
+        return "\n".join(lines)